@@ -1,108 +1,460 @@
-import re
 import sys
 import os
+import io
+import contextlib
 import functools
+import itertools
+import collections
 import time
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                             QPushButton, QLabel, QFileDialog, QMessageBox, QStackedWidget,
                             QListWidget, QProgressBar, QListWidgetItem)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
-from PyQt5.QtGui import QFont, QPixmap
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QFont, QPixmap, QClipboard
 from PyQt5.QtCore import QSettings
 
+# _format_time için sıfır dolgulu sayı tabloları
+_PAD2 = [f"{i:02d}" for i in range(100)]
+_PAD3 = [f"{i:03d}" for i in range(1000)]
+
+# Bir girdinin bitişi çoğu zaman sonrakinin başlangıcıdır; sonuçlar önbelleğe alınır
+@functools.lru_cache(maxsize=16384)
+def _format_time(seconds):
+    seconds, milliseconds = divmod(round(seconds * 1000), 1000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    # Hazır tablolar her çağrıda format spec ayrıştırılmasını önler
+    hours = _PAD2[hours] if hours < 100 else str(hours)
+    return f"{hours}:{_PAD2[minutes]}:{_PAD2[seconds]},{_PAD3[milliseconds]}"
+
+def parse_timestamp_line(line):
+    """'[MM:SS.mmm -> MM:SS.mmm] metin' satırını (başlangıç, bitiş, metin) olarak ayırır."""
+    # Biçim sabit olduğu için regex yerine doğrudan indekslerle ayrıştırılır
+    line = line.lstrip()
+    if not line.startswith('['):
+        return None
+
+    close = line.find(']')
+    if close < 0:
+        return None
+    arrow = line.find('->', 1, close)
+    if arrow < 0:
+        return None
+
+    try:
+        start_time = time_to_seconds(line[1:arrow].strip())
+        end_time = time_to_seconds(line[arrow + 2:close].strip())
+    except ValueError:
+        return None
+
+    return start_time, end_time, line[close + 1:].strip()
+
+def time_to_seconds(timestamp):
+    # Biçim her zaman M:SS.mmm; float() yerine tamsayı ayrıştırma yeterli.
+    # int() işaret, '_' ve boşluk da kabul ettiği için parçalar önce denetlenir.
+    colon = timestamp.index(':')
+    dot = timestamp.index('.', colon)
+    minutes = timestamp[:colon]
+    seconds = timestamp[colon + 1:dot]
+    fraction = timestamp[dot + 1:]
+    for part in (minutes, seconds, fraction):
+        if not (part.isascii() and part.isdigit()):
+            raise ValueError(f'Geçersiz zaman damgası: {timestamp!r}')
+    return max(0, int(minutes) * 60 + int(seconds)
+               + int(fraction) / 10 ** len(fraction))
+
+def split_lines(text):
+    """Metni, metin kipindeki open() gibi '\n', '\r\n' ve '\r' sonlarından böler."""
+    # Çoğu dosyada '\r' yoktur; o durumda ek kopya oluşturulmaz
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text.split('\n')
+
+def build_srt_entries(lines, subtitle_index=1):
+    """Satırları SRT girdilerine çevirir; (girdiler, sonraki sıra numarası) döner."""
+    # Döngüde her satır için tekrar edilen attribute aramalarını önle
+    parse_line = parse_timestamp_line
+    format_time = _format_time
+    entries = []
+    add_entry = entries.append
+    for line in lines:
+        # Boş satır ve başlıklar için ayrıştırıcı çağrısına hiç girilmez
+        if ']' not in line:
+            continue
+
+        parsed = parse_line(line)
+        if not parsed:
+            continue
+
+        start_time, end_time, text = parsed
+        if start_time >= end_time or not text:
+            continue
+
+        add_entry(f"{subtitle_index}\n"
+                  f"{format_time(start_time)} --> {format_time(end_time)}\n"
+                  f"{text}\n\n")
+        subtitle_index += 1
+
+    return ''.join(entries), subtitle_index
+
+# Stil sayfaları sayfa/öğe oluşturulurken tekrar tanımlanmaz, tek yerde tutulur
+_MAIN_STYLE = """
+    QMainWindow, QWidget {
+        background-color: #1a1a1a;
+    }
+    QPushButton {
+        background-color: #2d5af5;
+        color: white;
+        border: none;
+        padding: 15px 30px;
+        border-radius: 5px;
+        font-size: 16px;
+        min-width: 200px;
+    }
+    QPushButton:hover {
+        background-color: #1e3eb3;
+    }
+    QPushButton:disabled {
+        background-color: #333333;
+        color: #666666;
+    }
+    QLabel {
+        color: #ffffff;
+    }
+    QMessageBox {
+        background-color: #1a1a1a;
+        color: #ffffff;
+    }
+    QMessageBox QLabel {
+        color: #ffffff;
+    }
+    QMessageBox QPushButton {
+        min-width: 100px;
+    }
+"""
+
+_DESC_STYLE = """
+    font-size: 16px;
+    color: #999999;
+    margin-bottom: 40px;
+    padding: 0 20px;
+    min-height: 150px;
+"""
+
+_BACK_BTN_STYLE = """
+    QPushButton {
+        background-color: transparent;
+        color: white;
+        border: none;
+        font-size: 24px;
+        padding: 5px 15px;
+        min-width: 40px;
+    }
+    QPushButton:hover {
+        background-color: #2a2a2a;
+        border-radius: 5px;
+    }
+"""
+
+_LIST_STYLE = """
+    QListWidget {
+        background-color: #1E1E1E;
+        border: none;
+        border-radius: 8px;
+        color: #ffffff;
+        padding: 8px;
+        min-height: 200px;
+    }
+    QListWidget::item {
+        background-color: #2A2A2A;
+        border-radius: 6px;
+        margin: 4px;
+    }
+    QListWidget::item:hover {
+        background-color: #323232;
+    }
+    QListWidget::item:selected {
+        background-color: #2d5af5;
+    }
+"""
+
+_CLEAR_BTN_STYLE = """
+    QPushButton {
+        background-color: #ff3b30;
+    }
+    QPushButton:hover {
+        background-color: #d63029;
+    }
+"""
+
+_START_BTN_STYLE = """
+    QPushButton {
+        background-color: #28a745;
+        color: white;
+        border: none;
+        padding: 15px 30px;
+        border-radius: 5px;
+        font-size: 16px;
+        min-width: 200px;
+    }
+    QPushButton:hover {
+        background-color: #218838;
+    }
+    QPushButton:disabled {
+        background-color: #333333;
+        color: #666666;
+    }
+"""
+
+_PROGRESS_BAR_STYLE = """
+    QProgressBar {
+        border: none;
+        background-color: #2a2a2a;
+        height: 10px;
+        text-align: center;
+    }
+    QProgressBar::chunk {
+        background-color: #2d5af5;
+    }
+"""
+
+_ITEM_NAME_STYLE = """
+    color: white;
+    font-size: 14px;
+    font-weight: 500;
+"""
+
+_ITEM_PATH_STYLE = """
+    color: #8E8E8E;
+    font-size: 12px;
+"""
+
+_REMOVE_BTN_STYLE = """
+    QPushButton {
+        background-color: #ff3b30;
+        color: white;
+        border: none;
+        padding: 3px 8px;
+        border-radius: 2px;
+        font-size: 11px;
+        min-width: 45px;
+    }
+    QPushButton:hover {
+        background-color: #d63029;
+    }
+"""
+
+def output_exists(path):
+    """Çıktı yolunun var olup olmadığını tek bir lstat çağrısıyla kontrol eder."""
+    # os.path.exists gibi her OSError (dosya altındaki yol, izin, çok uzun ad) False sayılır
+    try:
+        os.lstat(path)
+    except OSError:
+        return False
+    return True
+
+def input_display_name(file_info):
+    """Listede ve ilerleme metninde gösterilecek girdi adını döner."""
+    if file_info['input'] is None:
+        return "Pasted Text"
+    return os.path.basename(file_info['input'])
+
 def resource_path(relative_path):
     """PyInstaller ile uyumlu kaynak dosya yolu oluşturur"""
     if hasattr(sys, '_MEIPASS'):
         return os.path.join(sys._MEIPASS, relative_path)
     return os.path.join(os.path.abspath("."), relative_path)
 
-class ConversionWorker(QThread):
+# Havuz süreçlerinde iptal bayrağı; süreç başlarken initializer ile atanır
+_pool_cancel_event = None
+
+def _init_pool_worker(cancel_event):
+    global _pool_cancel_event
+    _pool_cancel_event = cancel_event
+
+def _convert_in_pool(input_file, output_file, text=None):
+    """Havuzda çalışan dönüştürme; GUI'deki iptal isteği süren dosyayı da durdurur."""
+    ConversionWorker.convert_file(input_file, output_file, _pool_cancel_event, text=text)
+
+class ConversionSignals(QObject):
+    # QRunnable bir QObject olmadığı için sinyaller ayrı bir nesnede tutulur
     progress = pyqtSignal(int, str)
     finished = pyqtSignal()
     error = pyqtSignal(str)
 
-    def __init__(self, input_files, batch_size=100):
+class ConversionWorker(QRunnable):
+    def __init__(self, input_files, batch_size=100, max_workers=8, pool_threshold=16*1024*1024):
         super().__init__()
+        self.signals = ConversionSignals()
         self.input_files = input_files
         self.batch_size = batch_size
-        self._is_cancelled = False
+        self.max_workers = max_workers
+        self.pool_threshold = pool_threshold
+        self._cancel_event = threading.Event()
+        self._pool_cancel_event = None
+        self._last_progress = -1
+        self._last_emit = 0.0
 
     def run(self):
         try:
             self.process_files_in_batches()
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
         finally:
-            self.finished.emit()
+            self.signals.finished.emit()
 
     def process_files_in_batches(self):
         """Dosyaları batch'ler halinde işler."""
         total = len(self.input_files)
-        for i in range(0, total, self.batch_size):
-            if self._is_cancelled:
-                break
-                
-            batch = self.input_files[i:i + self.batch_size]
-            self.process_batch(batch, i, total)
+        # Süreç başlatmak (PyQt5 dahil yeniden import) küçük altyazıları dönüştürmekten
+        # pahalıdır; havuz yalnızca toplam girdi boyutu eşiği aşınca kullanılır
+        workers = min(os.cpu_count() or 1, total, self.max_workers)
+        executor = None
+        if workers > 1 and sum(map(self.input_size, self.input_files)) > self.pool_threshold:
+            # Çok thread'li GUI sürecinde fork kilitlenebilir; süreçler spawn ile açılır
+            context = multiprocessing.get_context('spawn')
+            self._pool_cancel_event = context.Event()
+            executor = ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                           initializer=_init_pool_worker,
+                                           initargs=(self._pool_cancel_event,))
+        try:
+            for i in range(0, total, self.batch_size):
+                if self._cancel_event.is_set():
+                    break
+                    
+                batch = self.input_files[i:i + self.batch_size]
+                self.process_batch(batch, i, total, executor)
+        finally:
+            if executor:
+                executor.shutdown(cancel_futures=True)
 
     def cancel(self):
         """Dönüştürme işlemini iptal eder."""
-        self._is_cancelled = True
+        self._cancel_event.set()
+        if self._pool_cancel_event is not None:
+            self._pool_cancel_event.set()
 
-    def process_batch(self, batch, index, total):
-        for i, file_info in enumerate(batch):
-            try:
-                input_file = file_info['input']
-                output_file = file_info['output']
-                
-                with open(input_file, "r", encoding='utf-8') as infile:
-                    lines = infile.readlines()
-                
-                with open(output_file, "w", encoding='utf-8') as outfile:
-                    subtitle_index = 1
-                    
-                    for line in lines:
-                        time_match = re.search(r'\[(\d+:\d+\.\d+)\s*->\s*(\d+:\d+\.\d+)\]', line)
-                        
-                        if time_match:
-                            start_time = self.time_to_seconds(time_match.group(1))
-                            end_time = self.time_to_seconds(time_match.group(2))
-                            
-                            if start_time >= end_time:
-                                continue
-                                
-                            outfile.write(f"{subtitle_index}\n")
-                            outfile.write(f"{self.format_time(start_time)} --> {self.format_time(end_time)}\n")
-                            
-                            text = re.sub(r'\[.*?\]', '', line).strip()
-                            if text:
-                                outfile.write(f"{text}\n\n")
-                                subtitle_index += 1
+    @staticmethod
+    def input_size(file_info):
+        """Girdinin yaklaşık boyutunu döner; okunamayan dosyalar 0 sayılır."""
+        if file_info['input'] is None:
+            return len(file_info['text'])
+        try:
+            return os.path.getsize(file_info['input'])
+        except OSError:
+            return 0  # Hata dönüştürme sırasında bildirilir
+
+    def process_batch(self, batch, index, total, executor=None):
+        if executor is None:
+            for i, file_info in enumerate(batch):
+                input_name = input_display_name(file_info)
+                try:
+                    self.convert_file(file_info['input'], file_info['output'], self._cancel_event,
+                                      text=file_info.get('text'))
+                except Exception as e:
+                    self.signals.error.emit(f"{input_name}: {str(e)}")
+                    continue
+                if self._cancel_event.is_set():
+                    return
                 
                 progress = int(((i + index) / total) * 100)
-                self.progress.emit(progress, os.path.basename(input_file))
+                self.emit_progress(progress, input_name)
+            return
+
+        # Dosyalar birbirinden bağımsız; havuzda paralel dönüştürülür
+        futures = {
+            executor.submit(_convert_in_pool, file_info['input'], file_info['output'],
+                            text=file_info.get('text')):
+                input_display_name(file_info)
+            for file_info in batch
+        }
+        for i, future in enumerate(as_completed(futures)):
+            if self._cancel_event.is_set():
+                for pending in futures:
+                    pending.cancel()
+                return
+            
+            input_name = futures[future]
+            try:
+                future.result()
             except Exception as e:
-                self.error.emit(f"{os.path.basename(input_file)}: {str(e)}")
+                self.signals.error.emit(f"{input_name}: {str(e)}")
                 continue
+            
+            progress = int(((i + index) / total) * 100)
+            self.emit_progress(progress, input_name)
 
-    def time_to_seconds(self, timestamp):
-        try:
-            m, s = map(float, timestamp.split(':'))
-            return max(0, m * 60 + s)
-        except ValueError:
-            raise ValueError(f"Invalid time format: {timestamp}")
-
-    def format_time(self, seconds):
-        milliseconds = int((seconds - int(seconds)) * 1000)
-        seconds = int(seconds)
-        minutes, seconds = divmod(seconds, 60)
-        hours, minutes = divmod(minutes, 60)
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
+    def emit_progress(self, progress, filename):
+        """İlerleme sinyalini seyreltir: yüzde değişince ya da en fazla 20 kez/sn."""
+        # Kuyruklu sinyaller GUI thread'ini her küçük dosyada yeniden çizime zorlar
+        now = time.monotonic()
+        if progress == self._last_progress and now - self._last_emit < 0.05:
+            return
+        self._last_progress = progress
+        self._last_emit = now
+        self.signals.progress.emit(progress, filename)
+
+    @staticmethod
+    def convert_file(input_file, output_file, cancel_event=None, stream_threshold=16*1024*1024,
+                     text=None):
+        """Tek bir Whisper dosyasını SRT'ye dönüştürür (süreç havuzunda çalışabilir).
+
+        text verilirse girdi dosyası yerine doğrudan bu metin dönüştürülür."""
+        source = open(input_file, "rb") if text is None else contextlib.nullcontext()
+        with source as infile:
+            # Yapıştırılan metin zaten bellekte; dosya sistemine hiç uğranmaz.
+            # Küçük dosyalar tek seferde okunup çözülür; büyük dosyalar tamamen
+            # belleğe alınmadan satır satır okunur. utf-8-sig, Not Defteri'nin eklediği
+            # BOM'u atar; aksi halde ilk satır '[' ile başlamaz ve ilk girdi kaybolur
+            if infile is None:
+                lines = split_lines(text)
+            elif os.fstat(infile.fileno()).st_size <= stream_threshold:
+                lines = split_lines(infile.read().decode('utf-8-sig'))
+            else:
+                lines = io.TextIOWrapper(infile, encoding='utf-8-sig')
+            
+            try:
+                outfile = open(output_file, "wb", buffering=1024*1024)
+            except FileNotFoundError:
+                # Dizin yalnızca eksikse oluşturulur; normal durumda ek stat çağrısı yapılmaz
+                os.makedirs(os.path.dirname(output_file), exist_ok=True)
+                outfile = open(output_file, "wb", buffering=1024*1024)
+        
+            with outfile:
+                subtitle_index = 1
+                lines = iter(lines)
+                while True:
+                    # İptal bayrağı her satırda değil, 4096 satırlık dilimlerde kontrol edilir
+                    if cancel_event is not None and cancel_event.is_set():
+                        return
+                    
+                    block = list(itertools.islice(lines, 4096))
+                    if not block:
+                        break
+                    
+                    # Girdiler dilim başına tek string olarak UTF-8'e çevrilir
+                    entries, subtitle_index = build_srt_entries(block, subtitle_index)
+                    if entries:
+                        outfile.write(entries.encode('utf-8'))
 
 class SubtitleConverter(QMainWindow):
     def __init__(self):
         super().__init__()
         self.files_to_convert = []  # Dosya listesini başlat
+        self._input_paths = set()  # Listedeki girdi yolları, tekrar kontrolü için
+        # Listedeki çıktı yolları; iki girdi aynı çıktıyı paylaşabildiği için sayılır
+        self._output_paths = collections.Counter()
+        self._conversion_failed = False  # Son dönüştürmede hata oluştu mu
+        self.worker = None
+        # Yapıştırma için önerilen çıktı klasörü; expanduser bir kez çağrılır
+        self._default_output_dir = os.path.expanduser('~/Desktop')
+        self._settings = QSettings('XeloxaSoft', 'WhisperToSRT')
+        # Sık kullanılan ileti kutuları pencereye ve başlığa bağlanmış olarak tutulur
+        self._err = functools.partial(QMessageBox.critical, self, 'Hata')
+        self._warn = functools.partial(QMessageBox.warning, self, 'Duplicate Output')
         self.setup_ui()
         self.setup_connections()
         self.load_settings()
@@ -122,48 +474,25 @@ class SubtitleConverter(QMainWindow):
 
     def load_settings(self):
         """Uygulama ayarlarını yükler."""
-        settings = QSettings('XeloxaSoft', 'WhisperToSRT')
-        geometry = settings.value('geometry')
+        geometry = self._settings.value('geometry')
         if geometry:
             self.restoreGeometry(geometry)
 
+    def save_settings(self):
+        """Uygulama ayarlarını kaydeder."""
+        self._settings.setValue('geometry', self.saveGeometry())
+
+    def closeEvent(self, event):
+        self.save_settings()
+        # Süren dönüştürme (havuzdaki süreçler dahil) bir sonraki dilimde durur
+        if self.worker is not None:
+            self.worker.cancel()
+        super().closeEvent(event)
+
     def initUI(self):
         self.setWindowTitle('Whisper Timestamp to SRT')
         self.setGeometry(100, 100, 600, 400)
-        self.setStyleSheet("""
-            QMainWindow, QWidget {
-                background-color: #1a1a1a;
-            }
-            QPushButton {
-                background-color: #2d5af5;
-                color: white;
-                border: none;
-                padding: 15px 30px;
-                border-radius: 5px;
-                font-size: 16px;
-                min-width: 200px;
-            }
-            QPushButton:hover {
-                background-color: #1e3eb3;
-            }
-            QPushButton:disabled {
-                background-color: #333333;
-                color: #666666;
-            }
-            QLabel {
-                color: #ffffff;
-            }
-            QMessageBox {
-                background-color: #1a1a1a;
-                color: #ffffff;
-            }
-            QMessageBox QLabel {
-                color: #ffffff;
-            }
-            QMessageBox QPushButton {
-                min-width: 100px;
-            }
-        """)
+        self.setStyleSheet(_MAIN_STYLE)
         
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -202,13 +531,7 @@ class SubtitleConverter(QMainWindow):
             'In other words, it does not convert VTT or other formats into SRT format (though these features may '
             'be added in future updates).'
         )
-        desc.setStyleSheet('''
-            font-size: 16px; 
-            color: #999999; 
-            margin-bottom: 40px;
-            padding: 0 20px;
-            min-height: 150px;
-        ''')
+        desc.setStyleSheet(_DESC_STYLE)
         desc.setAlignment(Qt.AlignCenter)
         desc.setWordWrap(True)
         desc.setFixedWidth(500)
@@ -254,20 +577,7 @@ class SubtitleConverter(QMainWindow):
         top_layout = QHBoxLayout()
         
         back_btn = QPushButton('←')
-        back_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: white;
-                border: none;
-                font-size: 24px;
-                padding: 5px 15px;
-                min-width: 40px;
-            }
-            QPushButton:hover {
-                background-color: #2a2a2a;
-                border-radius: 5px;
-            }
-        """)
+        back_btn.setStyleSheet(_BACK_BTN_STYLE)
         back_btn.clicked.connect(lambda: self.stack.setCurrentIndex(0))
         
         title_container = QWidget()
@@ -292,27 +602,7 @@ class SubtitleConverter(QMainWindow):
         layout.addLayout(top_layout)
         
         self.file_list = QListWidget()
-        self.file_list.setStyleSheet("""
-            QListWidget {
-                background-color: #1E1E1E;
-                border: none;
-                border-radius: 8px;
-                color: #ffffff;
-                padding: 8px;
-                min-height: 200px;
-            }
-            QListWidget::item {
-                background-color: #2A2A2A;
-                border-radius: 6px;
-                margin: 4px;
-            }
-            QListWidget::item:hover {
-                background-color: #323232;
-            }
-            QListWidget::item:selected {
-                background-color: #2d5af5;
-            }
-        """)
+        self.file_list.setStyleSheet(_LIST_STYLE)
         self.file_list.setAcceptDrops(True)
         self.file_list.itemDoubleClicked.connect(self.change_output_location)
         self.file_list.mousePressEvent = self.list_mouse_press_event
@@ -327,14 +617,7 @@ class SubtitleConverter(QMainWindow):
         select_btn.clicked.connect(self.select_input_files)
         
         clear_btn = QPushButton('Clear List')
-        clear_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #ff3b30;
-            }
-            QPushButton:hover {
-                background-color: #d63029;
-            }
-        """)
+        clear_btn.setStyleSheet(_CLEAR_BTN_STYLE)
         clear_btn.clicked.connect(self.clear_file_list)
         
         button_layout.addWidget(select_btn)
@@ -342,38 +625,11 @@ class SubtitleConverter(QMainWindow):
         
         self.input_next_btn = QPushButton('Start Conversion')
         self.input_next_btn.setEnabled(False)
-        self.input_next_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #28a745;
-                color: white;
-                border: none;
-                padding: 15px 30px;
-                border-radius: 5px;
-                font-size: 16px;
-                min-width: 200px;
-            }
-            QPushButton:hover {
-                background-color: #218838;
-            }
-            QPushButton:disabled {
-                background-color: #333333;
-                color: #666666;
-            }
-        """)
+        self.input_next_btn.setStyleSheet(_START_BTN_STYLE)
         self.input_next_btn.clicked.connect(self.start_batch_conversion)
         
         self.progress_bar = QProgressBar()
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: none;
-                background-color: #2a2a2a;
-                height: 10px;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background-color: #2d5af5;
-            }
-        """)
+        self.progress_bar.setStyleSheet(_PROGRESS_BAR_STYLE)
         self.progress_bar.hide()
         
         self.progress_label = QLabel('')
@@ -448,9 +704,7 @@ class SubtitleConverter(QMainWindow):
             new_files = []
             
             for input_file in files:
-                is_duplicate = any(file_info['input'] == input_file for file_info in self.files_to_convert)
-                
-                if is_duplicate:
+                if input_file in self._input_paths:
                     duplicate_files.append(os.path.basename(input_file))
                 else:
                     output_file = input_file.rsplit('.', 1)[0] + '.srt'
@@ -461,12 +715,7 @@ class SubtitleConverter(QMainWindow):
                     }
                     new_files.append(file_info)
             
-            for file_info in new_files:
-                self.files_to_convert.append(file_info)
-                self.update_list_item(len(self.files_to_convert) - 1)
-            
-            if new_files:
-                self.input_next_btn.setEnabled(True)
+            self.add_files(new_files)
             
             if duplicate_files:
                 files_str = "\n".join(duplicate_files)
@@ -476,13 +725,32 @@ class SubtitleConverter(QMainWindow):
                     f'The following files were not added because they are already in the list:\n\n{files_str}'
                 )
 
+    def add_files(self, file_infos):
+        """Dosyaları listeye toplu olarak ekler."""
+        if not file_infos:
+            return
+        
+        # Her öğe için ayrı yeniden çizim yapılmaması için güncellemeleri durdur
+        self.file_list.setUpdatesEnabled(False)
+        try:
+            # Satırlar modele tek bir insertRows çağrısıyla eklenir; öğeler aşağıda doldurulur
+            self.file_list.model().insertRows(len(self.files_to_convert), len(file_infos))
+            for file_info in file_infos:
+                self.files_to_convert.append(file_info)
+                if file_info['input'] is not None:
+                    self._input_paths.add(file_info['input'])
+                self._output_paths[file_info['output']] += 1
+                self.update_list_item(len(self.files_to_convert) - 1)
+        finally:
+            self.file_list.setUpdatesEnabled(True)
+            self.file_list.viewport().update()
+        
+        self.input_next_btn.setEnabled(True)
+
     def update_list_item(self, index):
         file_info = self.files_to_convert[index]
         
-        if file_info.get('is_clipboard'):
-            input_name = "Pasted Text"
-        else:
-            input_name = os.path.basename(file_info['input'])
+        input_name = input_display_name(file_info)
         
         output_name = os.path.basename(file_info['output'])
         
@@ -497,11 +765,7 @@ class SubtitleConverter(QMainWindow):
         info_layout.setSpacing(2)
         
         file_label = QLabel(input_name)
-        file_label.setStyleSheet("""
-            color: white;
-            font-size: 14px;
-            font-weight: 500;
-        """)
+        file_label.setStyleSheet(_ITEM_NAME_STYLE)
         
         if file_info['is_default_output']:
             path_text = f"→ {output_name} (Default Location)"
@@ -510,29 +774,13 @@ class SubtitleConverter(QMainWindow):
             path_text = f"→ {output_name} ({output_path})"
             
         path_label = QLabel(path_text)
-        path_label.setStyleSheet("""
-            color: #8E8E8E;
-            font-size: 12px;
-        """)
+        path_label.setStyleSheet(_ITEM_PATH_STYLE)
         
         info_layout.addWidget(file_label)
         info_layout.addWidget(path_label)
         
         remove_btn = QPushButton("Remove")
-        remove_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #ff3b30;
-                color: white;
-                border: none;
-                padding: 3px 8px;
-                border-radius: 2px;
-                font-size: 11px;
-                min-width: 45px;
-            }
-            QPushButton:hover {
-                background-color: #d63029;
-            }
-        """)
+        remove_btn.setStyleSheet(_REMOVE_BTN_STYLE)
         remove_btn.setCursor(Qt.PointingHandCursor)
         remove_btn.clicked.connect(lambda: self.remove_file(index))
         remove_btn.setFixedWidth(45)
@@ -541,20 +789,29 @@ class SubtitleConverter(QMainWindow):
         layout.addWidget(info_container, stretch=1)
         layout.addWidget(remove_btn)
         
-        list_item = QListWidgetItem()
-        list_item.setSizeHint(item_widget.sizeHint())
-        
+        # Var olan satır yeniden kullanılır; setItemWidget eski widget'ı siler
         if index < self.file_list.count():
-            self.file_list.takeItem(index)
-            self.file_list.insertItem(index, list_item)
+            list_item = self.file_list.item(index)
         else:
+            list_item = QListWidgetItem()
             self.file_list.addItem(list_item)
+        list_item.setSizeHint(item_widget.sizeHint())
         
         self.file_list.setItemWidget(list_item, item_widget)
 
+    def release_output_path(self, path):
+        """Çıktı yolunun sayacını azaltır; son kullanan da kalkınca yolu bırakır."""
+        count = self._output_paths[path] - 1
+        if count > 0:
+            self._output_paths[path] = count
+        else:
+            self._output_paths.pop(path, None)
+
     def remove_file(self, index):
         if 0 <= index < len(self.files_to_convert):
-            self.files_to_convert.pop(index)
+            removed = self.files_to_convert.pop(index)
+            self._input_paths.discard(removed['input'])
+            self.release_output_path(removed['output'])
             self.file_list.takeItem(index)
             
             for i in range(index, self.file_list.count()):
@@ -582,14 +839,15 @@ class SubtitleConverter(QMainWindow):
         )
         
         if new_output:
-            if not new_output.lower().endswith('.srt'):
+            if new_output[-4:].lower() != '.srt':
                 new_output += '.srt'
             
-            if os.path.exists(new_output):
+            if output_exists(new_output):
+                output_name = os.path.basename(new_output)
                 reply = QMessageBox.question(
                     self,
                     'File Already Exists',
-                    f'The file "{os.path.basename(new_output)}" already exists.\nDo you want to overwrite it?',
+                    f'The file "{output_name}" already exists.\nDo you want to overwrite it?',
                     QMessageBox.Yes | QMessageBox.No,
                     QMessageBox.No
                 )
@@ -597,20 +855,17 @@ class SubtitleConverter(QMainWindow):
                 if reply == QMessageBox.No:
                     return
             
+            self.release_output_path(file_info['output'])
+            self._output_paths[new_output] += 1
             self.files_to_convert[index]['output'] = new_output
             self.files_to_convert[index]['is_default_output'] = False
             self.update_list_item(index)
 
     def clear_file_list(self):
-        for file_info in self.files_to_convert:
-            if file_info.get('is_clipboard'):
-                try:
-                    os.remove(file_info['input'])
-                except:
-                    pass
-                
         self.file_list.clear()
         self.files_to_convert.clear()
+        self._input_paths.clear()
+        self._output_paths.clear()
         self.input_next_btn.setEnabled(False)
         self.progress_bar.hide()
         self.progress_label.hide()
@@ -622,7 +877,7 @@ class SubtitleConverter(QMainWindow):
             
         existing_files = []
         for file_info in self.files_to_convert:
-            if os.path.exists(file_info['output']):
+            if output_exists(file_info['output']):
                 existing_files.append(os.path.basename(file_info['output']))
         
         if existing_files:
@@ -643,26 +898,25 @@ class SubtitleConverter(QMainWindow):
         self.progress_bar.show()
         self.progress_label.show()
         
+        # Çıktı dizinleri burada kontrol edilmez; worker gerekirse kendisi oluşturur
         for file_info in self.files_to_convert:
-            if not os.path.exists(file_info['input']):
+            # Yapıştırılan metinlerin diskte karşılığı yoktur
+            if file_info['input'] is not None and not os.path.exists(file_info['input']):
                 QMessageBox.warning(self, 'Error', f"File not found: {file_info['input']}")
                 self.input_next_btn.setEnabled(True)
                 return
-                
-            output_dir = os.path.dirname(file_info['output'])
-            if not os.path.exists(output_dir):
-                try:
-                    os.makedirs(output_dir)
-                except Exception as e:
-                    QMessageBox.warning(self, 'Error', f"Could not create output directory: {output_dir}\n{str(e)}")
-                    self.input_next_btn.setEnabled(True)
-                    return
         
-        self.worker = ConversionWorker(self.files_to_convert)
-        self.worker.progress.connect(self.update_progress)
-        self.worker.finished.connect(self.conversion_finished)
-        self.worker.error.connect(self.show_error)
-        self.worker.start()
+        self.start_conversion_worker(self.files_to_convert, self.conversion_finished)
+
+    def start_conversion_worker(self, files, on_finished):
+        """Verilen dosyaları arka planda dönüştürecek worker'ı başlatır."""
+        # Her dönüştürmede yeni thread açmak yerine Qt'nin ortak thread havuzu kullanılır
+        self.worker = ConversionWorker(files)
+        self._conversion_failed = False
+        self.worker.signals.progress.connect(self.update_progress)
+        self.worker.signals.finished.connect(on_finished)
+        self.worker.signals.error.connect(self.show_error)
+        QThreadPool.globalInstance().start(self.worker)
 
     def update_progress(self, value, filename):
         self.progress_bar.setValue(value)
@@ -675,10 +929,11 @@ class SubtitleConverter(QMainWindow):
         self.clear_file_list()
 
     def show_error(self, message):
+        self._conversion_failed = True  # finished her durumda gelir; başarı mesajı atlanır
         QMessageBox.warning(self, 'Error', message)
 
     def select_output_file(self):
-        default_dir = os.path.dirname(self.files_to_convert[0]['input']) if self.files_to_convert else ''
+        default_dir = os.path.dirname(self.files_to_convert[0]['input'] or '') if self.files_to_convert else ''
         default_name = os.path.basename(self.files_to_convert[0]['output']) if self.files_to_convert else 'subtitle.srt'
         default_path = os.path.join(default_dir, default_name)
         
@@ -690,78 +945,58 @@ class SubtitleConverter(QMainWindow):
         )
         
         if file_name:
-            if not file_name.lower().endswith('.srt'):
+            if file_name[-4:].lower() != '.srt':
                 file_name += '.srt'
+            self.release_output_path(self.files_to_convert[0]['output'])
+            self._output_paths[file_name] += 1
             self.files_to_convert[0]['output'] = file_name
             self.output_label.setText(f'Selected: {file_name}')
             self.output_label.setStyleSheet('color: #999999; margin-bottom: 30px;')
             self.convert_btn.setEnabled(True)
             
     def start_conversion(self):
-        try:
-            self.convert_subtitles()
-            self.stack.setCurrentIndex(3)
-        except Exception as e:
-            QMessageBox.critical(self, 'Error', f'An error occurred during conversion:\n{str(e)}')
+        if not self.validate_conversion():
+            return
+        
+        # Tek dosya da toplu dönüştürmeyle aynı worker üzerinden işlenir
+        self.convert_btn.setEnabled(False)
+        self.start_conversion_worker([self.files_to_convert[0]], self.single_conversion_finished)
+        
+    def single_conversion_finished(self):
+        self.convert_btn.setEnabled(True)
+        if self._conversion_failed:
+            return  # Hata zaten gösterildi
+        self.show_success_message()
+        self.stack.setCurrentIndex(3)
             
     def restart_conversion(self):
         self.files_to_convert.clear()
+        self._input_paths.clear()
+        self._output_paths.clear()
         self.output_label.setText('No location selected')
         self.input_next_btn.setEnabled(False)
         self.convert_btn.setEnabled(False)
         self.stack.setCurrentIndex(0)
 
-    def convert_subtitles(self):
-        """Altyazı dosyasını SRT formatına dönüştürür."""
-        if not self.validate_conversion():
-            return
-        
-        try:
-            with open(self.files_to_convert[0]['input'], "r", encoding='utf-8') as infile:
-                lines = infile.readlines()
-                
-            self.process_subtitle_conversion(lines)
-            self.show_success_message()
-            
-        except FileNotFoundError:
-            QMessageBox.critical(self, 'Hata', 'Kaynak dosya bulunamadı.')
-        except PermissionError:
-            QMessageBox.critical(self, 'Hata', 'Dosya erişim izni reddedildi.')
-        except Exception as e:
-            QMessageBox.critical(self, 'Hata', f'Dönüştürme sırasında hata oluştu:\n{str(e)}')
-
     def validate_conversion(self):
         """Dönüştürme işlemi için gerekli kontrolleri yapar."""
         if not self.files_to_convert:
             QMessageBox.warning(self, 'Hata', 'Lütfen dönüştürülecek dosyaları seçin!')
             return False
         
-        if not os.path.exists(self.files_to_convert[0]['input']):
+        input_file = self.files_to_convert[0]['input']
+        if input_file is not None and not os.path.exists(input_file):
             QMessageBox.warning(self, 'Hata', 'Kaynak dosya bulunamadı!')
             return False
         
         return True
 
-    def process_subtitle_conversion(self, lines):
-        """Altyazı dönüştürme işlemini gerçekleştirir."""
-        total_lines = len(lines)
-        with open(self.files_to_convert[0]['output'], "w", encoding='utf-8') as outfile:
-            subtitle_index = 1
-            
-            for current_line, line in enumerate(lines, 1):
-                self.update_conversion_progress(current_line, total_lines)
-                
-                if subtitle := self.parse_subtitle_line(line, subtitle_index):
-                    outfile.write(subtitle)
-                    subtitle_index += 1
-
     def show_success_message(self):
         QMessageBox.information(self, 'Success', f'Conversion completed!\nFile saved as: {self.files_to_convert[0]["output"]}')
 
     def list_mouse_press_event(self, event):
         if event.button() == Qt.LeftButton and not self.file_list.itemAt(event.pos()):
-            clipboard = QApplication.clipboard()
-            text = clipboard.text()
+            text = self.clipboard_text()
             
             if text.strip():
                 reply = QMessageBox.question(
@@ -773,13 +1008,19 @@ class SubtitleConverter(QMainWindow):
                 )
                 
                 if reply == QMessageBox.Yes:
-                    self.paste_clipboard_text()
+                    self.paste_clipboard_text(text)
         
         super(QListWidget, self.file_list).mousePressEvent(event)
 
-    def paste_clipboard_text(self):
-        clipboard = QApplication.clipboard()
-        text = clipboard.text()
+    def clipboard_text(self):
+        """Panodaki metni mimeData üzerinden tek sorguyla okur."""
+        mime_data = QApplication.clipboard().mimeData(QClipboard.Clipboard)
+        return mime_data.text() if mime_data is not None and mime_data.hasText() else ''
+
+    def paste_clipboard_text(self, text=None):
+        # Çağıran metni zaten okuduysa pano yeniden sorgulanmaz
+        if text is None:
+            text = self.clipboard_text()
         
         if not text.strip():
             QMessageBox.warning(self, 'Error', 'No text found in clipboard!')
@@ -787,15 +1028,14 @@ class SubtitleConverter(QMainWindow):
         
         # Benzersiz dosya adı oluştur
         base_name = 'clipboard_text'
+        output_dir = self._default_output_dir
         counter = 1
         while True:
             suggested_name = f'{base_name}_{counter}.srt' if counter > 1 else f'{base_name}.srt'
-            suggested_path = os.path.join(os.path.expanduser('~/Desktop'), suggested_name)
+            suggested_path = os.path.join(output_dir, suggested_name)
             
             # Hem dosya sisteminde hem de dönüştürme listesinde kontrol et
-            if not os.path.exists(suggested_path) and not any(
-                file_info['output'] == suggested_path for file_info in self.files_to_convert
-            ):
+            if suggested_path not in self._output_paths and not output_exists(suggested_path):
                 break
             counter += 1
         
@@ -809,41 +1049,25 @@ class SubtitleConverter(QMainWindow):
         if not output_file:
             return
         
-        if not output_file.lower().endswith('.srt'):
+        if output_file[-4:].lower() != '.srt':
             output_file += '.srt'
         
         # Çıktı dosyası zaten listede mi kontrol et
-        for file_info in self.files_to_convert:
-            if file_info['output'] == output_file:
-                QMessageBox.warning(
-                    self,
-                    'Duplicate Output',
-                    f'The output file "{os.path.basename(output_file)}" already exists in the list.\nPlease choose a different name.'
-                )
-                return
+        if output_file in self._output_paths:
+            self._warn(
+                f'The output file "{os.path.basename(output_file)}" already exists in the list.\nPlease choose a different name.'
+            )
+            return
         
-        # Benzersiz geçici dosya oluştur
-        import tempfile
-        temp_dir = tempfile.gettempdir()
-        temp_input = os.path.join(temp_dir, f'clipboard_text_{int(time.time()*1000)}.txt')
+        # Metin bellekte tutulur; geçici dosyaya yazılıp tekrar okunmaz
+        file_info = {
+            'input': None,
+            'text': text,
+            'output': output_file,
+            'is_default_output': False
+        }
         
-        try:
-            with open(temp_input, 'w', encoding='utf-8') as f:
-                f.write(text)
-            
-            file_info = {
-                'input': temp_input,
-                'output': output_file,
-                'is_default_output': False,
-                'is_clipboard': True
-            }
-            
-            self.files_to_convert.append(file_info)
-            self.update_list_item(len(self.files_to_convert) - 1)
-            self.input_next_btn.setEnabled(True)
-            
-        except Exception as e:
-            QMessageBox.critical(self, 'Hata', f'Metin yapıştırılırken hata oluştu:\n{str(e)}')
+        self.add_files([file_info])
 
     def safe_file_operations(func):
         """Dosya işlemleri için güvenlik dekoratörü."""
@@ -851,41 +1075,101 @@ class SubtitleConverter(QMainWindow):
         def wrapper(self, *args, **kwargs):
             try:
                 return func(self, *args, **kwargs)
-            except PermissionError:
-                QMessageBox.critical(self, 'Hata', 'Dosya erişim izni reddedildi.')
             except OSError as e:
-                QMessageBox.critical(self, 'Hata', f'Dosya işlemi başarısız: {e}')
+                # PermissionError da bir OSError; mesaj tek dalda seçilir
+                if isinstance(e, PermissionError):
+                    message = 'Dosya erişim izni reddedildi.'
+                else:
+                    message = f'Dosya işlemi başarısız: {e}'
+                self._err(message)
             return None
         return wrapper
 
     @safe_file_operations
     def save_output_file(self, content, filepath):
         """Çıktı dosyasını güvenli bir şekilde kaydeder."""
-        temp_file = filepath + '.tmp'
-        
+        # Hedef yoksa geçici dosyaya gerek yok; O_EXCL ile doğrudan oluştur
+        try:
+            f = open(filepath, 'x', encoding='utf-8')
+        except FileExistsError:
+            pass
+        else:
+            try:
+                with f:
+                    f.write(content)
+            except OSError:
+                os.remove(filepath)  # Yarım kalan dosyayı bırakma
+                raise
+            return
+
+        # Geçici dosya hedefle aynı dizinde olmalı ki os.replace atomik kalsın
+        temp_file = f'{filepath}.tmp.{os.getpid()}.{id(content)}'
+
         with open(temp_file, 'w', encoding='utf-8') as f:
             f.write(content)
-        
+
         os.replace(temp_file, filepath)
 
-    def process_large_file(self, input_file, output_file, chunk_size=1024*1024):
+    def process_large_file(self, input_file, output_file, chunk_size=1024*1024, flush_size=1024*1024):
         """Büyük dosyaları chunk'lar halinde işler."""
-        with open(input_file, 'r', encoding='utf-8') as infile, \
-             open(output_file, 'w', encoding='utf-8') as outfile:
-            
-            buffer = []
+        input_size = os.path.getsize(input_file)
+        # Satır parçası ve sıra numarası çağrılar arasında yerel olarak taşınır
+        tail = ''
+        subtitle_index = 1
+
+        # Çoğu altyazı dosyası tek chunk'a sığar; döngü ve buffer kurulumuna gerek yok
+        if input_size <= chunk_size:
+            with open(input_file, 'r', encoding='utf-8-sig') as infile:
+                result, tail, subtitle_index = self.process_chunk(infile.read(), tail, subtitle_index)
+            if tail:  # Satır sonu olmadan biten son satır
+                result += self.process_chunk('\n', tail, subtitle_index)[0]
+            with open(output_file, 'wb') as outfile:
+                outfile.write(result.encode('utf-8'))
+            return
+
+        with open(input_file, 'r', encoding='utf-8-sig') as infile, \
+             open(output_file, 'wb') as outfile:
+
+            # SRT çıktısı girdiden biraz büyük olur; alanı baştan ayır
+            if hasattr(os, 'posix_fallocate'):
+                try:
+                    os.posix_fallocate(outfile.fileno(), 0, input_size * 5 // 4)
+                except OSError:
+                    pass  # Dosya sistemi desteklemiyor
+
+            # bytearray yerinde büyür; her flush'ta yeni string oluşturulmaz
+            buffer = bytearray()
             for chunk in iter(lambda: infile.read(chunk_size), ''):
-                processed_chunk = self.process_chunk(chunk)
-                buffer.append(processed_chunk)
-                
-                if len(buffer) >= 10:  # Buffer limitini kontrol et
-                    outfile.write(''.join(buffer))
+                entries, tail, subtitle_index = self.process_chunk(chunk, tail, subtitle_index)
+                buffer.extend(entries.encode('utf-8'))
+
+                # Bellekte tutulan veri flush_size ile sınırlı; clear() alanı da serbest bırakır
+                if len(buffer) >= flush_size:
+                    outfile.write(memoryview(buffer))
                     buffer.clear()
-                    
+
+            if tail:  # Satır sonu olmadan biten son satır
+                buffer.extend(self.process_chunk('\n', tail, subtitle_index)[0].encode('utf-8'))
+
             if buffer:  # Kalan buffer'ı yaz
-                outfile.write(''.join(buffer))
+                outfile.write(memoryview(buffer))
+
+            outfile.truncate()  # Ayrılan fazla alanı bırak
+
+    @staticmethod
+    def process_chunk(chunk, tail='', subtitle_index=1):
+        """Chunk içindeki tamamlanmış satırları SRT girdilerine dönüştürür.
+
+        (girdiler, yarım kalan satır, sonraki sıra numarası) döner."""
+        # Chunk sınırında bölünen satır bir sonraki chunk ile birleştirilir
+        lines = (tail + chunk).split('\n')
+        tail = lines.pop()
+
+        entries, subtitle_index = build_srt_entries(lines, subtitle_index)
+        return entries, tail, subtitle_index
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support()  # PyInstaller paketinde süreç havuzu için gerekli
     app = QApplication(sys.argv)
     app.setStyle('Fusion')
     converter = SubtitleConverter()